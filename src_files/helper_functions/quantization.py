@@ -0,0 +1,48 @@
+import torch
+
+from src_files.models.tresnet.layers.anti_aliasing import AntiAliasDownsampleLayer
+from src_files.models.tresnet.layers.frelu import FReLU, FReLUFused
+from src_files.models.tresnet.layers.general_layers import SEModuleFused, SpaceToDepthModule
+
+
+def quantize_tresnet_int8(model, calib_loader, num_calib_batches=32):
+    """Post-training INT8 quantization of a TResNet for CPU inference.
+
+    Folds Conv-BN first (fuse_for_inference) so FX sees plain convs, then
+    prepares with the x86 qconfig, calibrates on a few batches of tagger
+    images and converts. SpaceToDepthModule (scripted op),
+    AntiAliasDownsampleLayer (its Downsample reassigns self.filt in forward,
+    which tracing would turn into a stored Proxy) and the FReLU/SE modules are
+    kept as non-traceable fp32 leaves -- both their eager forms and the
+    FReLUFused/SEModuleFused variants fuse_for_inference swaps in, whose
+    scripted forwards FX cannot proxy through; the residual convs that
+    dominate runtime all quantize. For single-sample latency measurements call
+    torch.set_num_threads(1) first, otherwise intra-op threading hides the
+    VNNI win.
+    """
+    from torch.ao.quantization import get_default_qconfig_mapping
+    from torch.ao.quantization.fx.custom_config import PrepareCustomConfig
+    from torch.ao.quantization.quantize_fx import prepare_fx, convert_fx
+
+    model = model.cpu().eval()
+    if hasattr(model, "fuse_for_inference"):
+        model.fuse_for_inference()
+
+    example_input = next(iter(calib_loader))
+    if isinstance(example_input, (list, tuple)):
+        example_input = example_input[0]
+
+    prepare_custom_config = PrepareCustomConfig().set_non_traceable_module_classes(
+        [SpaceToDepthModule, AntiAliasDownsampleLayer, FReLU, FReLUFused, SEModuleFused])
+    prepared = prepare_fx(model, get_default_qconfig_mapping("x86"), (example_input,),
+                          prepare_custom_config=prepare_custom_config)
+
+    with torch.no_grad():
+        for i, batch in enumerate(calib_loader):
+            if isinstance(batch, (list, tuple)):
+                batch = batch[0]
+            prepared(batch.cpu())
+            if i + 1 >= num_calib_batches:
+                break
+
+    return convert_fx(prepared)
@@ -1,4 +1,5 @@
 import torch
+import torch.nn.functional as F
 from torch import nn
 
 
@@ -12,4 +13,29 @@ class FReLU(nn.Module):
 
     def forward(self, x):
         funnel_x = self.depthwise_conv_bn(x)
-        return torch.max(x, funnel_x)
\ No newline at end of file
+        return torch.max(x, funnel_x)
+
+
+@torch.jit.script
+def frelu_fused(x, weight, bias):
+    # depthwise conv + funnel max in one scripted call, so the JIT fuser can
+    # merge the pointwise max into the conv epilogue instead of a third pass
+    # over the activation
+    t = F.conv2d(x, weight, bias, stride=1, padding=1, groups=x.size(1))
+    return torch.maximum(x, t)
+
+
+class FReLUFused(nn.Module):
+    """Inference-time FReLU built from a BN-folded FReLU: the depthwise conv
+    (BN affine already merged into its weight/bias) and the funnel max run as
+    a single scripted call."""
+
+    def __init__(self, frelu):
+        super().__init__()
+        conv = frelu.depthwise_conv_bn
+        assert isinstance(conv, nn.Conv2d) and conv.bias is not None, \
+            "fold the BN into the depthwise conv before building FReLUFused"
+        self.conv = conv
+
+    def forward(self, x):
+        return frelu_fused(x, self.conv.weight, self.conv.bias)
\ No newline at end of file
@@ -33,7 +33,11 @@ class SpaceToDepthModule(nn.Module):
             self.op = SpaceToDepth()
 
     def forward(self, x):
-        return self.op(x)
+        out = self.op(x)
+        if x.is_contiguous(memory_format=torch.channels_last):
+            # the view/permute chain collapses to NCHW; keep NHWC inputs NHWC
+            out = out.contiguous(memory_format=torch.channels_last)
+        return out
 
 
 class SpaceToDepth(nn.Module):
@@ -91,3 +95,25 @@ class SEModule(nn.Module):
         x_se = self.fc2(x_se2)
         x_se = self.activation(x_se)
         return x * x_se
+
+
+@torch.jit.script
+def _se_fused(x, w1, b1, w2, b2):
+    s = x.mean([-2, -1], keepdim=True)
+    s = F.relu(F.conv2d(s, w1, b1))
+    s = torch.sigmoid(F.conv2d(s, w2, b2))
+    return x * s
+
+
+class SEModuleFused(nn.Module):
+    """Inference-time SEModule: one scripted call instead of five module
+    dispatches, letting the JIT fuser combine the pointwise tail
+    (relu/sigmoid/broadcast-mul) with the 1x1 conv outputs."""
+
+    def __init__(self, se_module):
+        super().__init__()
+        self.fc1 = se_module.fc1
+        self.fc2 = se_module.fc2
+
+    def forward(self, x):
+        return _se_fused(x, self.fc1.weight, self.fc1.bias, self.fc2.weight, self.fc2.bias)
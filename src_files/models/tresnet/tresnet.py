@@ -207,47 +207,33 @@ class TResNet(Module):
         return logits
 
 
+def _tresnet(layers, model_params, first_two_layers=BasicBlock):
+    return TResNet(layers=layers, num_classes=model_params['num_classes'], in_chans=3,
+                   first_two_layers=first_two_layers)
+
+
 def TResnetS(model_params):
     """Constructs a small TResnet model.
     """
-    in_chans = 3
-    num_classes = model_params['num_classes']
-    args = model_params['args']
-    model = TResNet(layers=[3, 4, 6, 3], num_classes=num_classes, in_chans=in_chans)
-    return model
+    return _tresnet([3, 4, 6, 3], model_params)
 
 def TResnetM(model_params):
     """Constructs a medium TResnet model.
     """
-    in_chans = 3
-    num_classes = model_params['num_classes']
-    model = TResNet(layers=[3, 4, 11, 3], num_classes=num_classes, in_chans=in_chans)
-    return model
+    return _tresnet([3, 4, 11, 3], model_params)
 
 def TResnetD(model_params):
     """Constructs a large TResnet model.
     """
-    in_chans = 3
-    num_classes = model_params['num_classes']
-    layers_list = [3, 6, 14, 3]
-    model = TResNet(layers=layers_list, num_classes=num_classes, in_chans=in_chans, first_two_layers=Bottleneck)
-    return model
+    return _tresnet([3, 6, 14, 3], model_params, first_two_layers=Bottleneck)
 
 def TResnetL(model_params):
     """Constructs a large TResnet model.
     """
-    in_chans = 3
-    num_classes = model_params['num_classes']
-    layers_list = [3, 4, 23, 3]
-    model = TResNet(layers=layers_list, num_classes=num_classes, in_chans=in_chans, first_two_layers=Bottleneck)
     #model = InplacABN_to_ABN(model)
-    return model
+    return _tresnet([3, 4, 23, 3], model_params, first_two_layers=Bottleneck)
 
 def TResnetXL(model_params):
     """Constructs a large TResnet model.
     """
-    in_chans = 3
-    num_classes = model_params['num_classes']
-    layers_list = [3, 8, 34, 5]
-    model = TResNet(layers=layers_list, num_classes=num_classes, in_chans=in_chans, first_two_layers=Bottleneck)
-    return model
\ No newline at end of file
+    return _tresnet([3, 8, 34, 5], model_params, first_two_layers=Bottleneck)
\ No newline at end of file
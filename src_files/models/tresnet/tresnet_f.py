@@ -1,12 +1,14 @@
 import torch
 import torch.nn as nn
+import torch.nn.functional as F
 from torch.nn import Module as Module
+from torch.nn.utils.fusion import fuse_conv_bn_eval
 from collections import OrderedDict
 
 from .layers.anti_aliasing import AntiAliasDownsampleLayer
 from .layers.avg_pool import FastAvgPool2d
-from .layers.frelu import FReLU
-from .layers.general_layers import SEModule, SpaceToDepthModule
+from .layers.frelu import FReLU, FReLUFused
+from .layers.general_layers import SEModule, SEModuleFused, SpaceToDepthModule
 
 def conv2d_BN(ni, nf, stride, kernel_size=3):
     return nn.Sequential(
@@ -52,14 +54,29 @@ class BasicBlock(Module):
 
         out = self.conv1(x)
         out = self.conv2(out)
+        out = self.se(out)
 
-        if self.se is not None: out = self.se(out)
+        return self.relu(out + residual)
 
-        out += residual
 
-        out = self.relu(out)
+class BasicBlockNoSE(BasicBlock):
+    # BasicBlock with the SE branch statically removed: no `if self.se` guard
+    # left in forward, so jit.script / torch.compile / graph capture see a
+    # fully static graph. construct via _make_layer(use_se=False)
+    def __init__(self, inplanes, planes, stride=1, downsample=None, use_se=False, anti_alias_layer=None):
+        super(BasicBlockNoSE, self).__init__(inplanes, planes, stride, downsample, use_se=False,
+                                             anti_alias_layer=anti_alias_layer)
 
-        return out
+    def forward(self, x):
+        if self.downsample is not None:
+            residual = self.downsample(x)
+        else:
+            residual = x
+
+        out = self.conv1(x)
+        out = self.conv2(out)
+
+        return self.relu(out + residual)
 
 
 class Bottleneck(Module):
@@ -94,13 +111,114 @@ class Bottleneck(Module):
 
         out = self.conv1(x)
         out = self.conv2(out)
-        if self.se is not None: out = self.se(out)
+        out = self.se(out)
+
+        out = self.conv3(out)
+        return self.relu(out + residual)  # no inplace, single Conv-Add-ReLU tail
+
+
+class BottleneckNoSE(Bottleneck):
+    # Bottleneck with the SE branch statically removed (layer4): same
+    # rationale as BasicBlockNoSE
+    def __init__(self, inplanes, planes, stride=1, downsample=None, use_se=False, anti_alias_layer=None):
+        super(BottleneckNoSE, self).__init__(inplanes, planes, stride, downsample, use_se=False,
+                                             anti_alias_layer=anti_alias_layer)
+
+    def forward(self, x):
+        if self.downsample is not None:
+            residual = self.downsample(x)
+        else:
+            residual = x
+
+        out = self.conv1(x)
+        out = self.conv2(out)
 
         out = self.conv3(out)
-        out = out + residual  # no inplace
-        out = self.relu(out)
+        return self.relu(out + residual)  # no inplace, single Conv-Add-ReLU tail
+
+
+# _make_layer swaps in the static variant when a stage is built with use_se=False
+_NO_SE_VARIANT = {BasicBlock: BasicBlockNoSE, Bottleneck: BottleneckNoSE}
+
+
+class StemConv(nn.Conv2d):
+    """SpaceToDepth(4) followed by a 3x3 stride-1 conv, collapsed into a single
+    12x12 stride-4 conv on the raw image: the sub-pixel permutation is
+    materialized into the kernel, so only `planes` output channels are written
+    instead of the 48-channel space-to-depth intermediate plus the conv output.
+    Subclasses nn.Conv2d so the Conv-BN fold still recognizes it."""
+
+    @classmethod
+    def from_space_to_depth(cls, conv):
+        c_in = conv.in_channels // 16
+        stem = cls(c_in, conv.out_channels, kernel_size=12, stride=4, padding=4,
+                   bias=conv.bias is not None)
+        with torch.no_grad():
+            for di in range(4):
+                for dj in range(4):
+                    block = (di * 4 + dj) * c_in
+                    stem.weight[:, :, di::4, dj::4] = conv.weight[:, block:block + c_in]
+            if conv.bias is not None:
+                stem.bias.copy_(conv.bias)
+        # fresh modules default to training mode; inherit the source conv's
+        # flag so a following fuse_for_inference doesn't see a "training"
+        # module inside an eval model
+        return stem.train(conv.training)
+
+
+class WeightOnlyInt8Linear(Module):
+    """nn.Linear with int8 weights and per-row fp32 scales. With 10k+ tag
+    classes the fc head is the single largest tensor in the model, so int8
+    storage cuts checkpoint size and resident weight memory ~4x. Note that
+    forward dequantizes into the activation dtype before F.linear, so the
+    GEMM itself still reads a full-size fp weight per call -- this is a
+    size/footprint win, not a bandwidth win; a fused int8 matmul
+    (torch._weight_int8pack_mm) could reclaim that but the op is private
+    and version-dependent. Activations stay floating point, so the body
+    sees no Q/DQ nodes."""
+
+    def __init__(self, linear):
+        super().__init__()
+        self.in_features = linear.in_features
+        self.out_features = linear.out_features
+        w = linear.weight.detach()
+        scale = w.abs().amax(dim=1).clamp(min=1e-8) / 127.0
+        self.register_buffer('weight', torch.round(w / scale[:, None]).to(torch.int8))
+        self.register_buffer('scale', scale.float())
+        if linear.bias is not None:
+            self.register_buffer('bias', linear.bias.detach().clone())
+        else:
+            self.bias = None
 
-        return out
+    def forward(self, x):
+        w = self.weight.to(x.dtype) * self.scale.to(x.dtype)[:, None]
+        return F.linear(x, w, self.bias)
+
+
+class _MkldnnConv(Module):
+    # a Conv2d pre-packed into oneDNN's blocked weight layout, so the per-call
+    # re-pack inside F.conv2d disappears. dense<->mkldnn conversion happens at
+    # the conv boundary because the surrounding ops (space-to-depth views,
+    # FReLU max, SE sigmoid-mul) do not accept mkldnn tensors
+    def __init__(self, conv):
+        super().__init__()
+        from torch.utils import mkldnn as mkldnn_utils
+        self.conv = mkldnn_utils.to_mkldnn(conv)
+
+    def forward(self, x):
+        return self.conv(x.to_mkldnn()).to_dense()
+
+
+class _ZeroBranch(Module):
+    # stands in for a Conv2d followed by an all-zero BatchNorm2d (a residual
+    # branch that never left its zero init): the pair outputs zeros whatever
+    # the input, so skip the conv entirely
+    def __init__(self, out_channels):
+        super().__init__()
+        self.out_channels = out_channels
+
+    def forward(self, x):
+        return x.new_zeros((x.size(0), self.out_channels, x.size(2), x.size(3)))
 
 
 class TResNet(Module):
@@ -135,29 +253,43 @@ class TResNet(Module):
             ('layer3', layer3),
             ('layer4', layer4)]))
 
-        # head
-        self.global_pool = nn.Sequential(OrderedDict([('global_pool_layer', global_pool_layer)]))
+        # head; no 1-element Sequential wrappers, the pool and fc are the
+        # modules themselves (smaller scripted IR, one less dispatch per call)
+        self.global_pool = global_pool_layer
         self.num_features = (self.planes * 8) * Bottleneck.expansion
-        fc = nn.Linear(self.num_features, num_classes)
-        self.head = nn.Sequential(OrderedDict([('fc', fc)]))
+        self.head = nn.Linear(self.num_features, num_classes)
 
-        # model initilization
+        # model initilization, single pass: modules() yields each block before
+        # its children, so the residual-branch BNs can be collected on the way
+        # down and zeroed when the BN itself comes up (in-place, so Parameter
+        # identity and any optimizer state referencing it survive)
+        residual_bn = set()
         for m in self.modules():
-            if isinstance(m, nn.Conv2d):
+            if isinstance(m, BasicBlock):
+                residual_bn.add(m.conv2[1])
+            elif isinstance(m, Bottleneck):
+                residual_bn.add(m.conv3[1])
+            elif isinstance(m, nn.Conv2d):
                 nn.init.kaiming_normal_(m.weight, mode='fan_out', nonlinearity='leaky_relu')
             elif isinstance(m, nn.BatchNorm2d):
-                nn.init.constant_(m.weight, 1)
+                nn.init.constant_(m.weight, 0 if m in residual_bn else 1)  # residual BN to zero
                 nn.init.constant_(m.bias, 0)
+            elif isinstance(m, nn.Linear):
+                m.weight.data.normal_(0, 0.01)
 
-        # residual connections special initialization
-        for m in self.modules():
-            if isinstance(m, BasicBlock):
-                m.conv2[1].weight = nn.Parameter(torch.zeros_like(m.conv2[1].weight))  # BN to zero
-            if isinstance(m, Bottleneck):
-                m.conv3[1].weight = nn.Parameter(torch.zeros_like(m.conv3[1].weight))  # BN to zero
-            if isinstance(m, nn.Linear): m.weight.data.normal_(0, 0.01)
+        self._graphs = {}  # CUDA graphs captured by capture_graph(), keyed by batch size
+        self._autocast_dtype = None  # set via enable_autocast()
+        self._pinned = None  # pinned H2D staging buffer used by infer_batched()
+        self._h2d_event = None  # marks when the in-flight copy from _pinned is done
+
+        # NHWC weights for faster cuDNN/oneDNN convs; callers should feed
+        # x.contiguous(memory_format=torch.channels_last) to stay in NHWC
+        # end-to-end (SpaceToDepthModule re-tags its output accordingly)
+        self.to(memory_format=torch.channels_last)
 
     def _make_layer(self, block, planes, blocks, stride=1, use_se=True, anti_alias_layer=None):
+        if not use_se:
+            block = _NO_SE_VARIANT.get(block, block)
         downsample = None
         if stride != 1 or self.inplanes != planes * block.expansion:
             layers = []
@@ -167,64 +299,431 @@ class TResNet(Module):
             layers += [conv2d_BN(self.inplanes, planes * block.expansion, kernel_size=1, stride=1)]
             downsample = nn.Sequential(*layers)
 
-        layers = []
-        layers.append(block(self.inplanes, planes, stride, downsample, use_se=use_se,
-                            anti_alias_layer=anti_alias_layer))
+        layers = [block(self.inplanes, planes, stride, downsample, use_se=use_se,
+                        anti_alias_layer=anti_alias_layer)]
         self.inplanes = planes * block.expansion
-        for i in range(1, blocks): layers.append(
-            block(self.inplanes, planes, use_se=use_se, anti_alias_layer=anti_alias_layer))
+        layers += [block(self.inplanes, planes, use_se=use_se, anti_alias_layer=anti_alias_layer)
+                   for _ in range(1, blocks)]
         return nn.Sequential(*layers)
 
+    def quantize_head(self):
+        # weight-only INT8 for the classification head; no-op when the head
+        # was replaced (ml-decoder) or already quantized
+        if isinstance(self.head, nn.Linear):
+            self.head = WeightOnlyInt8Linear(self.head)
+        return self
+
+    def load_state_dict(self, state_dict, strict=True):
+        # checkpoints saved before the 1-element Sequential wrappers were
+        # flattened carry 'head.fc.*' / 'global_pool.global_pool_layer.*' keys
+        remapped = OrderedDict()
+        for k, v in state_dict.items():
+            if k.startswith('head.fc.'):
+                k = 'head.' + k[len('head.fc.'):]
+            elif k.startswith('global_pool.global_pool_layer.'):
+                k = 'global_pool.' + k[len('global_pool.global_pool_layer.'):]
+            remapped[k] = v
+        return super(TResNet, self).load_state_dict(remapped, strict)
+
+    def prepack_cpu(self):
+        # pre-pack every body conv into oneDNN's blocked layout for CPU
+        # inference (eval-mode float32 only). a wholesale
+        # torch.utils.mkldnn.to_mkldnn(model) is not usable here because the
+        # non-conv ops in between reject mkldnn tensors, so each conv is
+        # wrapped individually. pair with torch.set_num_threads tuned to
+        # physical cores; run fuse_for_inference first so the BNs are gone
+        assert not self.training, "call model.eval() before prepack_cpu()"
+
+        def _wrap(module):
+            # only wrap convs that are invoked as modules: FReLUFused and
+            # SEModuleFused read their conv's .weight/.bias attributes in
+            # forward, which _MkldnnConv does not expose
+            if isinstance(module, (FReLUFused, SEModuleFused)):
+                return
+            for name, child in module._modules.items():
+                if child is None:
+                    continue
+                if isinstance(child, nn.Conv2d):
+                    module._modules[name] = _MkldnnConv(child)
+                else:
+                    _wrap(child)
+
+        _wrap(self.body)
+        return self
+
+    def infer_batched(self, cpu_tensor):
+        # stage CPU batches through a persistent pinned buffer so the H2D copy
+        # is asynchronous and overlaps with compute instead of a pageable
+        # blocking cudaMemcpy per batch; replays a captured CUDA graph when
+        # one exists. on CPU-only setups this is just forward()
+        if not torch.cuda.is_available():
+            return self.forward(cpu_tensor)
+        if self._pinned is None or self._pinned.shape != cpu_tensor.shape:
+            self._pinned = torch.empty_like(cpu_tensor, pin_memory=True)
+        elif self._h2d_event is not None:
+            # the previous call's non_blocking upload may still be reading the
+            # buffer; wait for it before overwriting on the host
+            self._h2d_event.synchronize()
+        self._pinned.copy_(cpu_tensor)
+        gpu_in = self._pinned.to("cuda", non_blocking=True)
+        if self._h2d_event is None:
+            self._h2d_event = torch.cuda.Event()
+        self._h2d_event.record()
+        if self._graphs:
+            return self.graph_infer(gpu_in)
+        return self.forward(gpu_in)
+
+    def compile_for_inference(self, mode="reduce-overhead", dynamic=False):
+        # Inductor-compile the model; reduce-overhead + dynamic=False traces
+        # the per-block Python (the downsample/se attributes are set once in
+        # __init__ and never mutated, so Dynamo specializes the branches away)
+        # into a CUDA-graph-backed callable. for varying batch sizes use
+        # mode='max-autotune', dynamic=True instead: slower first call, no
+        # graph replay. named compile_for_inference because nn.Module.compile
+        # already exists (and compiles in place)
+        torch.set_float32_matmul_precision("high")
+        return torch.compile(self, backend="inductor", mode=mode, dynamic=dynamic)
+
+    def enable_autocast(self, dtype="bf16"):
+        # run body+pool in half precision via autocast; the fc head stays
+        # fp32 to preserve logit precision. combine with the channels_last
+        # layout so the autocasted convs hit tensor-core NHWC kernels
+        dtypes = {"bf16": torch.bfloat16, "fp16": torch.float16, None: None}
+        self._autocast_dtype = dtypes[dtype]
+        return self
+
+    def _pooled_embeddings(self, x):
+        # no attribute writes here: keeping the forward path side-effect free
+        # is what allows jit.freeze and CUDA-graph capture, and avoids
+        # retaining the pooled features across calls
+        dtype = self._autocast_dtype
+        if dtype is not None:
+            with torch.autocast(device_type=x.device.type, dtype=dtype):
+                x = self.body(x)
+                embeddings = self.global_pool(x)
+            embeddings = embeddings.float()
+        else:
+            x = self.body(x)
+            embeddings = self.global_pool(x)
+        return embeddings
+
     def forward(self, x):
-        x = self.body(x)
-        self.embeddings = self.global_pool(x)
-        logits = self.head(self.embeddings)
-        return logits
+        return self.head(self._pooled_embeddings(x))
+
+    @torch.jit.export
+    def forward_with_embeddings(self, x):
+        # separate method instead of a return_embeddings flag on forward:
+        # scripting requires each method to have a single static return type
+        embeddings = self._pooled_embeddings(x)
+        return self.head(embeddings), embeddings
+
+    def fuse_for_inference(self):
+        # fold every BatchNorm2d into its preceding bias-less Conv2d (conv2d_BN,
+        # conv2d_FReLU and the depthwise conv inside FReLU all match this pattern).
+        # call once after model.eval(); removes one full pass over activation
+        # memory per BN. the zero-initialized residual BNs fold exactly as well
+        # (w'=0, b'=beta), so numerics are bit-identical to the eager model.
+        assert not self.training, "call model.eval() before fuse_for_inference()"
+
+        def _fuse(module):
+            for name, child in module._modules.items():
+                if child is None:
+                    continue
+                if isinstance(child, nn.Sequential) and len(child) >= 2 \
+                        and isinstance(child[0], nn.Conv2d) and child[0].bias is None \
+                        and isinstance(child[1], nn.BatchNorm2d):
+                    conv, bn = child[0], child[1]
+                    rest = list(child.children())[2:]
+                    if not rest and conv.stride == (1, 1) \
+                            and bn.weight.abs().max().item() < 1e-8 \
+                            and bn.bias.abs().max().item() < 1e-8:
+                        # residual-branch BN still at its zero init: the whole
+                        # conv+BN computes a constant zero, skip it entirely
+                        module._modules[name] = _ZeroBranch(conv.out_channels)
+                        continue
+                    fused = fuse_conv_bn_eval(conv, bn)
+                    module._modules[name] = nn.Sequential(fused, *rest) if rest else fused
+                elif isinstance(child, SEModule):
+                    module._modules[name] = SEModuleFused(child)
+                    continue
+                elif isinstance(child, FReLU):
+                    _fuse(child)  # fold its depthwise conv+BN first
+                    if isinstance(child.depthwise_conv_bn, nn.Conv2d):
+                        module._modules[name] = FReLUFused(child)
+                    continue
+                # recurse through the (possibly just replaced) child so FReLUs
+                # inside new Sequentials are reached too
+                _fuse(module._modules[name])
+
+        _fuse(self.body)
+        return self
+
+    def fuse_downsample(self):
+        # merge each downsample AvgPool2d(2,2) + 1x1 conv into a single 2x2
+        # stride-2 conv: the box filter folds into the weights (w_1x1 / 4 in
+        # every tap), exact whenever H/W are even, which the stride-4 stem
+        # guarantees. run after fuse_for_inference so the 1x1 conv already
+        # carries its BN; the trained model keeps the AvgPool+1x1+BN form
+        assert not self.training, "call model.eval() before fuse_downsample()"
+        for m in self.modules():
+            if not isinstance(m, (BasicBlock, Bottleneck)) or m.downsample is None:
+                continue
+            ds = m.downsample
+            if not (isinstance(ds, nn.Sequential) and len(ds) == 2
+                    and isinstance(ds[0], nn.AvgPool2d) and isinstance(ds[1], nn.Conv2d)
+                    and ds[1].kernel_size == (1, 1)):
+                continue
+            conv1x1 = ds[1]
+            fused = nn.Conv2d(conv1x1.in_channels, conv1x1.out_channels, kernel_size=2,
+                              stride=2, bias=conv1x1.bias is not None)
+            with torch.no_grad():
+                fused.weight.copy_(conv1x1.weight.div(4).expand(-1, -1, 2, 2))
+                if conv1x1.bias is not None:
+                    fused.bias.copy_(conv1x1.bias)
+            m.downsample = fused
+        return self
+
+    def fuse_stem(self):
+        # collapse SpaceToDepth + the 3x3 of conv1 into one strided conv on the
+        # raw image (block size is 4 here, so the fused kernel is 12x12,
+        # stride 4, padding 4); the BN/FReLU tail of conv1 stays in place and
+        # fuse_for_inference handles it in either order
+        assert not self.training, "call model.eval() before fuse_stem()"
+        conv = self.body.conv1[0]
+        if isinstance(conv, StemConv) or not isinstance(self.body.SpaceToDepth, SpaceToDepthModule):
+            return self
+        self.body.conv1[0] = StemConv.from_space_to_depth(conv)
+        self.body.SpaceToDepth = nn.Identity()
+        return self
+
+    def _swap_stem_for_export(self):
+        # replace the scripted space-to-depth with nn.PixelUnshuffle(4) so ONNX
+        # and TensorRT see a recognized primitive. pixel_unshuffle orders the
+        # 16 sub-pixel planes per input channel (c-major) while SpaceToDepth
+        # orders them plane-major, so permute conv1's input channels to match
+        if not isinstance(self.body.SpaceToDepth, SpaceToDepthModule):
+            return  # stem already replaced (fuse_stem or a previous export)
+        conv = self.body.conv1[0]
+        c_in = conv.in_channels // 16
+        perm = [t * c_in + c for c in range(c_in) for t in range(16)]
+        conv.weight.data = conv.weight.data[:, perm].contiguous()
+        self.body.SpaceToDepth = nn.PixelUnshuffle(4)
+
+    def export_trt(self, calib_loader, path, opset_version=17):
+        """Export an INT8+FP16 TensorRT engine to `path` (ONNX kept alongside).
+
+        Folds Conv-BN, swaps the scripted space-to-depth for pixel_unshuffle
+        so TensorRT only sees primitives it can fuse, exports ONNX with
+        constant folding (plus polygraphy sanitize when installed), then
+        builds with both INT8 and FP16 enabled, calibrating with an entropy
+        calibrator fed from calib_loader. Requires tensorrt and pycuda.
+        """
+        import os
+        import shutil
+        import subprocess
+        import tensorrt as trt
+        import pycuda.autoinit  # noqa: F401  creates the CUDA context
+        import pycuda.driver as cuda
+
+        self.eval()
+        self.fuse_for_inference()
+        self._swap_stem_for_export()
+
+        example = next(iter(calib_loader))
+        if isinstance(example, (list, tuple)):
+            example = example[0]
+        example = example.to(next(self.parameters()).device)
+
+        onnx_path = os.path.splitext(path)[0] + ".onnx"
+        torch.onnx.export(self, example, onnx_path, opset_version=opset_version,
+                          do_constant_folding=True,
+                          input_names=["input"], output_names=["logits"])
+        if shutil.which("polygraphy"):
+            subprocess.run(["polygraphy", "surgeon", "sanitize", onnx_path,
+                            "--fold-constants", "-o", onnx_path], check=True)
+
+        class _EntropyCalibrator(trt.IInt8EntropyCalibrator2):
+            def __init__(self, loader, cache_file):
+                super().__init__()
+                self.iterator = iter(loader)
+                self.cache_file = cache_file
+                self.device_mem = None
+
+            def get_batch_size(self):
+                return example.size(0)
+
+            def get_batch(self, names):
+                try:
+                    batch = next(self.iterator)
+                except StopIteration:
+                    return None
+                if isinstance(batch, (list, tuple)):
+                    batch = batch[0]
+                arr = batch.contiguous().float().cpu().numpy()
+                if self.device_mem is None:
+                    self.device_mem = cuda.mem_alloc(arr.nbytes)
+                cuda.memcpy_htod(self.device_mem, arr)
+                return [int(self.device_mem)]
+
+            def read_calibration_cache(self):
+                if os.path.exists(self.cache_file):
+                    with open(self.cache_file, "rb") as f:
+                        return f.read()
+
+            def write_calibration_cache(self, cache):
+                with open(self.cache_file, "wb") as f:
+                    f.write(cache)
+
+        trt_logger = trt.Logger(trt.Logger.WARNING)
+        builder = trt.Builder(trt_logger)
+        network = builder.create_network(1 << int(trt.NetworkDefinitionCreationFlag.EXPLICIT_BATCH))
+        parser = trt.OnnxParser(network, trt_logger)
+        with open(onnx_path, "rb") as f:
+            if not parser.parse(f.read()):
+                raise RuntimeError("ONNX parse failed: %s" % parser.get_error(0))
+        config = builder.create_builder_config()
+        config.set_flag(trt.BuilderFlag.FP16)
+        config.set_flag(trt.BuilderFlag.INT8)
+        config.int8_calibrator = _EntropyCalibrator(calib_loader, path + ".calib")
+        engine = builder.build_serialized_network(network, config)
+        if engine is None:
+            raise RuntimeError("TensorRT engine build failed")
+        with open(path, "wb") as f:
+            f.write(engine)
+        return path
+
+    def export_openvino(self, calib_loader, out_dir):
+        """Export an INT8 OpenVINO IR for CPU-only tagging on Intel machines.
+
+        Folds Conv-BN, swaps the scripted space-to-depth for pixel_unshuffle,
+        exports FP32 ONNX (opset 13), quantizes with NNCF post-training
+        quantization calibrated on calib_loader and writes model.xml/.bin to
+        out_dir. At tagging time prefer the IR whenever openvino is
+        importable. Requires the openvino and nncf packages.
+        """
+        import os
+        import nncf
+        import openvino as ov
+
+        self.eval()
+        self.fuse_for_inference()
+        self._swap_stem_for_export()
+
+        example = next(iter(calib_loader))
+        if isinstance(example, (list, tuple)):
+            example = example[0]
+
+        os.makedirs(out_dir, exist_ok=True)
+        onnx_path = os.path.join(out_dir, "model.onnx")
+        torch.onnx.export(self.cpu(), example.cpu(), onnx_path, opset_version=13,
+                          do_constant_folding=True,
+                          input_names=["input"], output_names=["logits"])
+
+        def _first(item):
+            return item[0] if isinstance(item, (list, tuple)) else item
+
+        ov_model = ov.Core().read_model(onnx_path)
+        calib_dataset = nncf.Dataset(calib_loader, transform_func=lambda b: _first(b).cpu().numpy())
+        quantized = nncf.quantize(ov_model, calib_dataset)
+        xml_path = os.path.join(out_dir, "model.xml")
+        ov.save_model(quantized, xml_path)
+        return xml_path
+
+    def capture_graph(self, example_input, batch_sizes=(1, 2, 4)):
+        # capture one CUDA graph per batch size so replay skips the per-kernel
+        # launch overhead of the ~hundreds of small kernels in the body.
+        # fixed shapes only: example_input fixes C/H/W, batch_sizes the batches.
+        assert not self.training, "call model.eval() before capture_graph()"
+        assert example_input.is_cuda, "capture_graph() needs a CUDA example input"
+        self._graphs = {}
+        # everything below runs under no_grad: eval() alone leaves autograd
+        # on, and capturing with grad would bake saved activations and a
+        # grad_fn over the static buffers into the replayed graph
+        with torch.no_grad():
+            side_stream = torch.cuda.Stream()
+            side_stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(side_stream):
+                for _ in range(3):  # warmup allocations outside capture
+                    self.forward(example_input)
+            torch.cuda.current_stream().wait_stream(side_stream)
+            for bs in sorted(set(batch_sizes)):
+                static_in = torch.empty((bs,) + tuple(example_input.shape[1:]),
+                                        device=example_input.device, dtype=example_input.dtype)
+                graph = torch.cuda.CUDAGraph()
+                with torch.cuda.graph(graph):
+                    static_out = self.forward(static_in)
+                self._graphs[bs] = (graph, static_in, static_out)
+        return self
+
+    def graph_infer(self, x):
+        # replay the smallest captured graph that fits x, zero-padding the
+        # batch dimension when needed
+        assert self._graphs, "call capture_graph() before graph_infer()"
+        bs = x.size(0)
+        fitting = [b for b in sorted(self._graphs) if b >= bs]
+        assert fitting, "batch size %d larger than any captured graph" % bs
+        graph, static_in, static_out = self._graphs[fitting[0]]
+        if bs < static_in.size(0):
+            static_in[:bs].copy_(x)
+            static_in[bs:].zero_()
+        else:
+            static_in.copy_(x)
+        graph.replay()
+        return static_out[:bs].clone()
+
+
+def jit_freeze_for_inference(model):
+    """Script, freeze and optimize a TResNet for inference.
+
+    Returns a ScriptModule that replaces the eager model at inference time:
+    freezing inlines the ~50-100 sub-module calls into one IR and
+    optimize_for_inference applies the Conv-BN / Conv-Add / Conv-Add-ReLU
+    fusions (the block forwards end in relu(out + residual) to expose the
+    Conv-Add-ReLU pattern).
+
+    Autocast must be off: the torch.autocast call in the forward path takes
+    its device from the input and TorchScript requires a constant device
+    argument, so the branch only scripts while it is dead. For a half
+    precision frozen module, convert the model with .half() instead.
+    """
+    assert getattr(model, "_autocast_dtype", None) is None, \
+        "disable autocast (enable_autocast(None)) before jit_freeze_for_inference(); " \
+        "the autocast branch is not scriptable"
+    scripted = torch.jit.script(model).eval()
+    # freeze drops exported methods unless preserved explicitly
+    scripted = torch.jit.freeze(scripted, preserved_attrs=["forward_with_embeddings"])
+    return torch.jit.optimize_for_inference(scripted, other_methods=["forward_with_embeddings"])
+
+
+def _tresnet(layers, model_params, first_two_layers=BasicBlock):
+    return TResNet(layers=layers, num_classes=model_params['num_classes'], in_chans=3,
+                   first_two_layers=first_two_layers)
 
 
 def TResnetS(model_params):
     """Constructs a small TResnet model.
     """
-    in_chans = 3
-    num_classes = model_params['num_classes']
-    args = model_params['args']
-    model = TResNet(layers=[3, 4, 6, 3], num_classes=num_classes, in_chans=in_chans)
-    return model
+    return _tresnet([3, 4, 6, 3], model_params)
 
 #Flops:47.50G, params:55.16M
 def TResnetM(model_params):
     """Constructs a medium TResnet model.
     """
-    in_chans = 3
-    num_classes = model_params['num_classes']
-    model = TResNet(layers=[3, 4, 11, 3], num_classes=num_classes, in_chans=in_chans)
-    return model
+    return _tresnet([3, 4, 11, 3], model_params)
 
 #Flops:67.70G, params:64.67M
 def TResnetD(model_params):
     """Constructs a large TResnet model.
     """
-    in_chans = 3
-    num_classes = model_params['num_classes']
-    layers_list = [3, 6, 14, 3]
-    model = TResNet(layers=layers_list, num_classes=num_classes, in_chans=in_chans, first_two_layers=Bottleneck)
-    return model
+    return _tresnet([3, 6, 14, 3], model_params, first_two_layers=Bottleneck)
 
 #Flops:73.07G, params:70.01M
 def TResnetL(model_params):
     """Constructs a large TResnet model.
     """
-    in_chans = 3
-    num_classes = model_params['num_classes']
-    layers_list = [3, 4, 23, 3]
-    model = TResNet(layers=layers_list, num_classes=num_classes, in_chans=in_chans, first_two_layers=Bottleneck)
-    return model
+    return _tresnet([3, 4, 23, 3], model_params, first_two_layers=Bottleneck)
 
 def TResnetXL(model_params):
     """Constructs a large TResnet model.
     """
-    in_chans = 3
-    num_classes = model_params['num_classes']
-    layers_list = [3, 8, 34, 5]
-    model = TResNet(layers=layers_list, num_classes=num_classes, in_chans=in_chans, first_two_layers=Bottleneck)
-    return model
\ No newline at end of file
+    return _tresnet([3, 8, 34, 5], model_params, first_two_layers=Bottleneck)
\ No newline at end of file
@@ -56,6 +56,7 @@ def create_model(args, load_head=False, colo=False):
                 key = 'state_dict'
             filtered_dict = {k: v for k, v in state[key].items() if
                              (k in model.state_dict() and ('head.fc' not in k)
+                              and (k != 'head.weight') and (k != 'head.bias')
                               and ('head.decoder.duplicate_pooling' not in k)
                               and ('head.decoder.duplicate_pooling_bias' not in k)
                               and ('head.decoder.query_embed.weight' not in k)
@@ -0,0 +1,46 @@
+import torch
+
+from src_files.models.tresnet.tresnet_f import TResNet, jit_freeze_for_inference
+
+
+def tiny_model():
+    return TResNet(layers=[1, 1, 1, 1], num_classes=10).eval()
+
+
+def test_forward_with_embeddings_matches_forward():
+    model = tiny_model()
+    x = torch.randn(2, 3, 64, 64)
+    with torch.no_grad():
+        logits = model(x)
+        logits2, embeddings = model.forward_with_embeddings(x)
+    assert torch.equal(logits, logits2)
+    assert embeddings.shape == (2, model.num_features)
+
+
+def test_jit_freeze_for_inference_runs_and_matches_eager():
+    model = tiny_model()
+    x = torch.randn(1, 3, 64, 64)
+    frozen = jit_freeze_for_inference(model)
+    with torch.no_grad():
+        eager = model(x)
+        scripted = frozen(x)
+        frozen_logits, frozen_emb = frozen.forward_with_embeddings(x)
+    assert torch.allclose(eager, scripted, rtol=1e-4, atol=1e-5)
+    assert torch.allclose(scripted, frozen_logits, rtol=1e-4, atol=1e-5)
+    assert frozen_emb.shape == (1, model.num_features)
+
+
+def test_fuse_then_prepack_then_forward():
+    import pytest
+    if not torch.backends.mkldnn.is_available():
+        pytest.skip("mkldnn backend not available")
+    model = tiny_model()
+    x = torch.randn(1, 3, 64, 64)
+    with torch.no_grad():
+        eager = model(x)
+        model.fuse_for_inference()
+        fused = model(x)
+        model.prepack_cpu()
+        prepacked = model(x)
+    assert torch.allclose(eager, fused, rtol=1e-3, atol=1e-4)
+    assert torch.allclose(fused, prepacked, rtol=1e-3, atol=1e-4)